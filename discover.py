@@ -20,8 +20,13 @@ Arguments:
 import asyncio
 import logging
 import argparse
-from datetime import datetime
-from typing import Dict, List
+import signal
+import sys
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Tuple
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
@@ -37,12 +42,28 @@ SUPPORTED_DEVICES: List[str] = [
     "VSON#WP6810",  # Air quality sensor
 ]
 
+# Prefixes as a tuple so str.startswith can match all of them in one call
+_SUPPORTED_PREFIXES = tuple(sys.intern(prefix) for prefix in SUPPORTED_DEVICES)
+
+# Model names of supported devices, for help text
+_SUPPORTED_MODELS_STR = ", ".join(
+    prefix.partition(DEVICE_NAME_SEPARATOR)[2] for prefix in SUPPORTED_DEVICES
+)
+
 # Signal strength thresholds (dBm)
 RSSI_EXCELLENT = -50
 RSSI_GOOD = -60
 RSSI_FAIR = -70
 RSSI_WEAK = -80
 
+# Repeated advertisements at unchanged RSSI within this window (seconds)
+# only refresh last_seen
+DUPLICATE_WINDOW = 0.5
+
+# Ascending thresholds and the category for each interval between them
+_RSSI_BREAKS = (RSSI_WEAK, RSSI_FAIR, RSSI_GOOD, RSSI_EXCELLENT)
+_RSSI_LABELS = ("very weak", "weak", "fair", "good", "excellent")
+
 # Table column widths for output formatting
 COL_WIDTH_MAC = 20
 COL_WIDTH_NAME = 30
@@ -50,8 +71,63 @@ COL_WIDTH_MODEL = 10
 COL_WIDTH_SERIAL = 10
 COL_WIDTH_RSSI = 20
 
-# Tracked devices: MAC -> device info dict
-discovered_devices: Dict[str, dict] = {}
+# Table header and separator lines
+_TABLE_HEADER = " ".join(
+    (
+        "MAC Address".ljust(COL_WIDTH_MAC),
+        "Device Name".ljust(COL_WIDTH_NAME),
+        "Model".ljust(COL_WIDTH_MODEL),
+        "Serial".ljust(COL_WIDTH_SERIAL),
+        "RSSI".ljust(COL_WIDTH_RSSI),
+    )
+)
+_TABLE_SEP = "=" * len(_TABLE_HEADER)
+
+
+class DeviceRecord:
+    """Information tracked for a discovered device."""
+
+    __slots__ = (
+        "name",
+        "manufacturer",
+        "model",
+        "serial",
+        "rssi",
+        "first_seen",
+        "last_seen",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        manufacturer: str,
+        model: str,
+        serial: str,
+        rssi: int,
+        now: float,
+    ):
+        self.name: str = name
+        self.manufacturer: str = manufacturer
+        self.model: str = model
+        self.serial: str = serial
+        self.rssi: int = rssi
+        # time.monotonic() readings in seconds
+        self.first_seen: float = now
+        self.last_seen: float = now
+
+
+# Tracked devices: MAC -> device record
+discovered_devices: Dict[str, DeviceRecord] = {}
+
+# Advertisements waiting to be processed: (MAC, name, RSSI, monotonic time).
+# When full, the oldest entries are dropped.
+ADV_QUEUE_SIZE = 1024
+pending_advertisements: Deque[Tuple[str, str, int, float]] = deque(
+    maxlen=ADV_QUEUE_SIZE
+)
+
+# Root logger, used to skip formatting output that would be discarded
+_root_logger = logging.getLogger()
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -70,48 +146,7 @@ def setup_logging(debug: bool = False) -> None:
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
-def get_device_name(device: BLEDevice, adv_data: AdvertisementData) -> str:
-    """
-    Extract device name from BLE device and advertisement data.
-
-    Args:
-        device: BLE device object
-        adv_data: Advertisement data containing device name
-
-    Returns:
-        Device name string, or "unknown" if not available
-    """
-    return adv_data.local_name or device.name or "unknown"
-
-
-def is_supported_device(device: BLEDevice, adv_data: AdvertisementData) -> bool:
-    """
-    Check if the discovered device is a supported VSON device.
-
-    Device name format: MANUFACTURER#MODEL#SERIAL
-    Example: VSON#WP6810#000000
-
-    Args:
-        device: BLE device object
-        adv_data: Advertisement data containing device name
-
-    Returns:
-        True if device matches any supported device pattern
-    """
-    device_name = get_device_name(device, adv_data)
-
-    if not device_name or device_name == "unknown":
-        return False
-
-    # Check if device name starts with any supported prefix
-    for supported_prefix in SUPPORTED_DEVICES:
-        if device_name.startswith(supported_prefix):
-            return True
-
-    return False
-
-
-def parse_device_name(device_name: str) -> Dict[str, str]:
+def parse_device_name(device_name: str) -> Tuple[str, str, str]:
     """
     Parse device name into components.
 
@@ -122,17 +157,20 @@ def parse_device_name(device_name: str) -> Dict[str, str]:
         device_name: Full device name
 
     Returns:
-        Dictionary with manufacturer, model, and serial fields
+        Tuple of (manufacturer, model, serial)
     """
-    parts = device_name.split(DEVICE_NAME_SEPARATOR)
-    # Pad with "unknown" if parts are missing
-    parts.extend(["unknown"] * (3 - len(parts)))
+    manufacturer, found, rest = device_name.partition(DEVICE_NAME_SEPARATOR)
+    if not found:
+        return sys.intern(manufacturer), "unknown", "unknown"
 
-    return {
-        "manufacturer": parts[0],
-        "model": parts[1],
-        "serial": parts[2],
-    }
+    model, _, serial = rest.partition(DEVICE_NAME_SEPARATOR)
+
+    # Manufacturer and model repeat across devices, so share one string object
+    return (
+        sys.intern(manufacturer),
+        sys.intern(model or "unknown"),
+        serial or "unknown",
+    )
 
 
 def get_signal_strength(rssi: int) -> str:
@@ -145,18 +183,10 @@ def get_signal_strength(rssi: int) -> str:
     Returns:
         Signal strength category string
     """
-    if rssi >= RSSI_EXCELLENT:
-        return "excellent"
-    elif rssi >= RSSI_GOOD:
-        return "good"
-    elif rssi >= RSSI_FAIR:
-        return "fair"
-    elif rssi >= RSSI_WEAK:
-        return "weak"
-    else:
-        return "very weak"
+    return _RSSI_LABELS[bisect_right(_RSSI_BREAKS, rssi)]
 
 
+@lru_cache(maxsize=256)
 def format_rssi(rssi: int) -> str:
     """
     Format RSSI value with signal strength indicator.
@@ -186,95 +216,126 @@ def format_device_row(
     Returns:
         Formatted table row string
     """
-    return (
-        f"{mac:<{COL_WIDTH_MAC}} "
-        f"{device_name:<{COL_WIDTH_NAME}} "
-        f"{model:<{COL_WIDTH_MODEL}} "
-        f"{serial:<{COL_WIDTH_SERIAL}} "
-        f"{format_rssi(rssi):<{COL_WIDTH_RSSI}}"
+    return " ".join(
+        (
+            mac.ljust(COL_WIDTH_MAC),
+            device_name.ljust(COL_WIDTH_NAME),
+            model.ljust(COL_WIDTH_MODEL),
+            serial.ljust(COL_WIDTH_SERIAL),
+            format_rssi(rssi).ljust(COL_WIDTH_RSSI),
+        )
     )
 
 
-def detection_callback(device: BLEDevice, adv_data: AdvertisementData) -> None:
+def make_detection_callback() -> Callable[[BLEDevice, AdvertisementData], None]:
     """
-    Callback function invoked when a BLE device is detected.
+    Build the scanner detection callback.
 
-    This function filters for supported VSON devices and updates the tracked
-    devices dictionary with latest information.
+    The names used on every advertisement are bound as closure variables
+    so the callback avoids global lookups. Must be called from within the
+    running event loop.
+
+    Returns:
+        Callback to pass to BleakScanner
+    """
+    prefixes = _SUPPORTED_PREFIXES
+    queue = pending_advertisements
+    enqueue = queue.append
+    clock = monotonic
+    call_soon = asyncio.get_running_loop().call_soon
+    process = process_advertisements
+
+    def detection_callback(device: BLEDevice, adv_data: AdvertisementData) -> None:
+        """
+        Callback function invoked when a BLE device is detected.
+
+        This function filters for supported VSON devices and queues their
+        advertisements; the tracked devices are updated later by
+        process_advertisements() so the callback itself stays short.
+
+        Args:
+            device: BLE device object with MAC address and name
+            adv_data: Advertisement data with RSSI and additional info
+        """
+        # Filter: only supported devices
+        device_name = adv_data.local_name or device.name
+        if not device_name or not device_name.startswith(prefixes):
+            return
+
+        enqueue((device.address, device_name, adv_data.rssi, clock()))
+
+        # Queue was empty, so no processing pass is scheduled yet
+        if len(queue) == 1:
+            call_soon(process)
+
+    return detection_callback
+
+
+def process_advertisements() -> None:
+    """Update tracked devices from all queued advertisements."""
+    queue = pending_advertisements
+    try:
+        while queue:
+            mac, device_name, rssi, now = queue.popleft()
+            update_device(mac, device_name, rssi, now)
+    finally:
+        # The callback only schedules a pass when the queue was empty, so
+        # if an update raised, schedule the next pass for what is left
+        if queue:
+            asyncio.get_running_loop().call_soon(process_advertisements)
+
+
+def update_device(mac: str, device_name: str, rssi: int, now: float) -> None:
+    """
+    Record a single advertisement from a supported device.
 
     Args:
-        device: BLE device object with MAC address and name
-        adv_data: Advertisement data with RSSI and additional info
+        mac: Device MAC address
+        device_name: Full device name
+        rssi: Signal strength in dBm
+        now: time.monotonic() reading when the advertisement was received
     """
-    # Filter: only supported devices
-    if not is_supported_device(device, adv_data):
+    # Update known devices in place, register new ones
+    existing = discovered_devices.get(mac)
+    if existing is not None:
+        previous_seen = existing.last_seen
+        existing.last_seen = now
+        if existing.rssi == rssi and now - previous_seen < DUPLICATE_WINDOW:
+            return
+        existing.rssi = rssi
+        if _root_logger.isEnabledFor(logging.DEBUG):
+            logging.debug("Device update - MAC: %s, RSSI: %s", mac, format_rssi(rssi))
         return
 
-    mac = device.address
-    device_name = get_device_name(device, adv_data)
-    device_info = parse_device_name(device_name)
-    rssi = adv_data.rssi
-    now = datetime.now()
-
-    # Check if this is a new device
-    is_new = mac not in discovered_devices
-
-    # Update device info
-    discovered_devices[mac] = {
-        "name": device_name,
-        "manufacturer": device_info["manufacturer"],
-        "model": device_info["model"],
-        "serial": device_info["serial"],
-        "rssi": rssi,
-        "last_seen": now,
-        "first_seen": discovered_devices.get(mac, {}).get("first_seen", now),
-    }
-
-    if is_new:
+    manufacturer, model, serial = parse_device_name(device_name)
+    discovered_devices[mac] = DeviceRecord(
+        device_name, manufacturer, model, serial, rssi, now
+    )
+
+    if _root_logger.isEnabledFor(logging.DEBUG):
         logging.debug(
             "New device discovered - MAC: %s, Name: %s, Model: %s, Serial: %s, RSSI: %s",
             mac,
             device_name,
-            device_info["model"],
-            device_info["serial"],
+            model,
+            serial,
             format_rssi(rssi),
         )
-        # Output new device to console
-        logging.info(
-            format_device_row(
-                mac, device_name, device_info["model"], device_info["serial"], rssi
-            )
-        )
-    else:
-        logging.debug("Device update - MAC: %s, RSSI: %s", mac, format_rssi(rssi))
+    # Output new device to console
+    if _root_logger.isEnabledFor(logging.INFO):
+        logging.info("%s", format_device_row(mac, device_name, model, serial, rssi))
 
 
 def print_table_header() -> None:
     """Display table header once at startup."""
-    total_width = (
-        COL_WIDTH_MAC
-        + COL_WIDTH_NAME
-        + COL_WIDTH_MODEL
-        + COL_WIDTH_SERIAL
-        + COL_WIDTH_RSSI
-        + 4
-    )
-    separator = "=" * total_width
-    header = (
-        f"{'MAC Address':<{COL_WIDTH_MAC}} "
-        f"{'Device Name':<{COL_WIDTH_NAME}} "
-        f"{'Model':<{COL_WIDTH_MODEL}} "
-        f"{'Serial':<{COL_WIDTH_SERIAL}} "
-        f"{'RSSI':<{COL_WIDTH_RSSI}}"
-    )
-    logging.info("%s", separator)
-    logging.info("%s", header)
-    logging.info("%s", separator)
+    logging.info("%s", _TABLE_SEP)
+    logging.info("%s", _TABLE_HEADER)
+    logging.info("%s", _TABLE_SEP)
 
 
 async def scan_loop() -> None:
     """Main scanning loop that continuously discovers BLE devices."""
-    scanner = BleakScanner(detection_callback=detection_callback)
+    scanner = BleakScanner(detection_callback=make_detection_callback())
 
     logging.info("Starting BLE scanner for supported VSON devices...")
     logging.info("Supported models: %s", ", ".join(SUPPORTED_DEVICES))
@@ -288,9 +349,19 @@ async def scan_loop() -> None:
         logging.error("Failed to start BLE scanner: %s", e)
         raise
 
+    # Sleep until a termination signal arrives instead of polling
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Not available on Windows; Ctrl+C cancels the wait instead
+            pass
+
     try:
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
+        logging.debug("Stop signal received")
 
     except asyncio.CancelledError:
         logging.debug("Scanning cancelled")
@@ -304,9 +375,8 @@ async def scan_loop() -> None:
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
-    supported_models = ", ".join([s.split("#")[1] for s in SUPPORTED_DEVICES])
     parser = argparse.ArgumentParser(
-        description=f"Scan for VSON BLE devices (supported models: {supported_models})",
+        description=f"Scan for VSON BLE devices (supported models: {_SUPPORTED_MODELS_STR})",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -334,4 +404,5 @@ if __name__ == "__main__":
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        logging.info("Exiting cleanly.")
+        pass
+    logging.info("Exiting cleanly.")
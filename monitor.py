@@ -25,6 +25,7 @@ Arguments:
     --mqtt-user USER        MQTT username (optional)
     --mqtt-password PASS    MQTT password (optional)
     --mqtt-topic TOPIC      MQTT topic prefix (default: homeassistant/sensor/vson)
+    --mqtt-interval SECONDS Minimum interval between MQTT state publishes (default: 1)
     --mqtt-auto-home-assistant  Enable Home Assistant MQTT discovery
     --debug                 Enable DEBUG level logging
     --log FILE              Log to file
@@ -33,24 +34,47 @@ Arguments:
 
 import asyncio
 import logging
-import argparse
 import json
 import sys
+import threading
 import random
-import re
+import signal
+import socket
+import struct
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
-from bleak import BleakClient
-from bleak.exc import BleakError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Callable, Union
+from weakref import WeakKeyDictionary
+
+# bleak and paho-mqtt are imported where they are first needed, so --help
+# and argument errors return without loading them
+if TYPE_CHECKING:
+    import argparse
+    import paho.mqtt.client as mqtt
+    from bleak import BleakClient
 
-# Optional MQTT support
+# Optional fast JSON serialization (falls back to compact stdlib json)
 try:
-    import paho.mqtt.client as mqtt
+    import orjson
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize object to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_dumps_str(obj: Any) -> str:
+        """Serialize object to a compact JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
 
-    MQTT_AVAILABLE = True
 except ImportError:
-    MQTT_AVAILABLE = False
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Serialize object to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def json_dumps_str(obj: Any) -> str:
+        """Serialize object to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
 
 
 # ==== Protocol Constants ====
@@ -86,6 +110,9 @@ UUID_CMD = "0000fff3-0000-1000-8000-00805f9b34fb"
 # Commands
 CMD_START = bytes.fromhex("03")
 
+# Fixed trailer of the time synchronization packet
+_TIME_SYNC_TAIL = bytes.fromhex("00 06 40 00 1e")
+
 # Protocol constants
 PACKET_SIZE_DATA = 20
 PACKET_SIZE_META = 8
@@ -94,6 +121,25 @@ PARTICLE_MULTIPLIER_LSB = 6250
 PARTICLE_MULTIPLIER_CORRECTION = 3.53
 PARTICLE_DIVISOR = 1000.0
 
+# Combined per-LSB particle factor (6250 * 3.53 / 1000 = 22.0625)
+_PARTICLE_LSB_SCALE = (
+    PARTICLE_MULTIPLIER_LSB * PARTICLE_MULTIPLIER_CORRECTION / PARTICLE_DIVISOR
+)
+
+# Precompiled frame layouts (little-endian)
+# DATA: year-2000, month, day, hour, minute, second (u8 each),
+#       pm2.5, pm1, pm10, unknown1 (u16 each), unused(4), counter(u8), flag(u8)
+_DATA_STRUCT = struct.Struct("<6BHHHH4sBB")
+# META: flag, year-2000, month, day, hour, minute, second, mode (all u8)
+_META_STRUCT = struct.Struct("<8B")
+
+# Characters allowed in the byte pairs of a --device MAC address
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Reconnection backoff (seconds): doubles per failed attempt up to the cap
+RECONNECT_DELAY_BASE = 5
+RECONNECT_DELAY_MAX = 300
+
 
 # ==== Configuration ====
 
@@ -101,6 +147,30 @@ PARTICLE_DIVISOR = 1000.0
 class Config:
     """Global configuration container."""
 
+    __slots__ = (
+        "device_address",
+        "output_format",
+        "include_history",
+        "mqtt_enabled",
+        "mqtt_host",
+        "mqtt_port",
+        "mqtt_user",
+        "mqtt_password",
+        "mqtt_topic",
+        "mqtt_auto_discovery",
+        "debug",
+        "log_file",
+        "log_level",
+        "mqtt_client",
+        "mqtt_connection_failed_count",
+        "mqtt_max_connection_attempts",
+        "mqtt_fatal_error",
+        "mqtt_connect_done",
+        "response_timeout",
+        "mqtt_publish_interval",
+        "mqtt_state_topic",
+    )
+
     def __init__(self):
         self.device_address: str = ""
         self.output_format: str = "text"
@@ -115,24 +185,51 @@ class Config:
         self.debug: bool = False
         self.log_file: Optional[str] = None
         self.log_level: str = "INFO"
-        self.mqtt_client: Optional[mqtt.Client] = None
+        self.mqtt_client: Optional["mqtt.Client"] = None
         self.mqtt_connection_failed_count: int = 0
         self.mqtt_max_connection_attempts: int = 5
         self.mqtt_fatal_error: bool = False
+        # Set once the initial MQTT connection succeeds or fails fatally
+        self.mqtt_connect_done: threading.Event = threading.Event()
         self.response_timeout: int = 300  # 5 minutes in seconds
+        self.mqtt_publish_interval: float = 1.0  # seconds, 0 = every reading
+        self.mqtt_state_topic: Optional[str] = None  # derived on first publish
 
 
 class SensorState:
     """Runtime sensor state container."""
 
+    __slots__ = (
+        "latest_battery",
+        "last_data_time",
+        "data_event",
+        "event_loop",
+        "mqtt_pending",
+        "mqtt_flush_handle",
+        "reconnect_attempt",
+    )
+
     def __init__(self):
         self.latest_battery: int = 0
         self.last_data_time: Optional[float] = None
+        # Set on every notification (and on MQTT fatal error) to wake the
+        # monitoring loop; created per connection inside the event loop
+        self.data_event: Optional[asyncio.Event] = None
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Latest MQTT state not yet published: (topic, payload)
+        self.mqtt_pending: Optional[Tuple[str, Dict[str, Any]]] = None
+        # Timer ending the current MQTT publish interval
+        self.mqtt_flush_handle: Optional[asyncio.TimerHandle] = None
+        # Reconnections since the last established session (backoff exponent)
+        self.reconnect_attempt: int = 0
 
 
 config = Config()
 sensor_state = SensorState()
 
+# Root logger, used to skip formatting debug output that would be discarded
+_root_logger = logging.getLogger()
+
 
 # ==== Logging Setup ====
 
@@ -153,11 +250,21 @@ def setup_logging() -> None:
     )
     console_handler.setFormatter(console_formatter)
 
-    # Root logger
+    # Root logger (level follows the most verbose handler so that
+    # isEnabledFor() checks skip work no handler would output)
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(console_level)
     root_logger.addHandler(console_handler)
 
+    # None of the formats use caller, thread, process or task fields, so
+    # skip collecting them for every record (see the logging HOWTO,
+    # "Optimization"; logAsyncioTasks only exists on Python 3.12+)
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     # Silence noisy third-party loggers
     logging.getLogger("bleak").setLevel(logging.WARNING)
     logging.getLogger("dbus_fast").setLevel(logging.WARNING)
@@ -173,6 +280,7 @@ def setup_logging() -> None:
         )
         file_handler.setFormatter(file_formatter)
         root_logger.addHandler(file_handler)
+        root_logger.setLevel(min(console_level, file_level))
         logging.info(
             "Logging to file: %s (level: %s)", config.log_file, config.log_level
         )
@@ -181,12 +289,21 @@ def setup_logging() -> None:
 # ==== MQTT Support ====
 
 
+def wake_monitor() -> None:
+    """Wake the monitoring loop from a non-asyncio thread (MQTT callbacks)."""
+    loop = sensor_state.event_loop
+    event = sensor_state.data_event
+    if loop is not None and event is not None:
+        loop.call_soon_threadsafe(event.set)
+
+
 def mqtt_on_connect(client, _userdata, _flags, reason_code, _properties):
     """MQTT connection callback (API v2)."""
     if reason_code == 0:
         logging.info("Connected to MQTT broker")
         # Reset failure counter on successful connection
         config.mqtt_connection_failed_count = 0
+        config.mqtt_connect_done.set()
     else:
         logging.error("MQTT connection failed with code %s", reason_code)
         config.mqtt_connection_failed_count += 1
@@ -198,6 +315,8 @@ def mqtt_on_connect(client, _userdata, _flags, reason_code, _properties):
                 config.mqtt_max_connection_attempts,
             )
             config.mqtt_fatal_error = True
+            config.mqtt_connect_done.set()
+            wake_monitor()
             client.disconnect()
 
 
@@ -214,15 +333,27 @@ def mqtt_on_disconnect(client, _userdata, _disconnect_flags, reason_code, _prope
                 config.mqtt_max_connection_attempts,
             )
             config.mqtt_fatal_error = True
+            config.mqtt_connect_done.set()
+            wake_monitor()
             client.disconnect()
 
 
-def setup_mqtt() -> Optional[mqtt.Client]:
+def mqtt_on_socket_open(_client, _userdata, sock):
+    """MQTT socket callback: disable Nagle so small state messages go out immediately."""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError) as e:
+        logging.debug("Could not set TCP_NODELAY on MQTT socket: %s", e)
+
+
+def setup_mqtt() -> Optional["mqtt.Client"]:
     """Initialize MQTT client connection."""
     if not config.mqtt_enabled:
         return None
 
-    if not MQTT_AVAILABLE:
+    try:
+        import paho.mqtt.client as mqtt
+    except ImportError:
         logging.error("MQTT support requested but paho-mqtt not installed")
         logging.error("Install with: pip install paho-mqtt")
         sys.exit(1)
@@ -237,6 +368,7 @@ def setup_mqtt() -> Optional[mqtt.Client]:
     client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
     client.on_connect = mqtt_on_connect
     client.on_disconnect = mqtt_on_disconnect
+    client.on_socket_open = mqtt_on_socket_open
 
     if config.mqtt_user and config.mqtt_password:
         client.username_pw_set(config.mqtt_user, config.mqtt_password)
@@ -247,21 +379,12 @@ def setup_mqtt() -> Optional[mqtt.Client]:
         client.loop_start()
 
         # Wait up to 15 seconds for initial connection or fatal error
-        import time
-
-        max_wait = 15
-        waited = 0
-        while waited < max_wait:
-            if config.mqtt_fatal_error:
-                logging.error("MQTT connection failed, exiting")
-                sys.exit(1)
-            if config.mqtt_connection_failed_count == 0 and waited > 1:
-                # Successfully connected (counter was reset)
-                break
-            time.sleep(0.5)
-            waited += 0.5
-
-        # Final check after timeout
+        if not config.mqtt_connect_done.wait(timeout=15):
+            logging.warning(
+                "MQTT broker has not confirmed the connection yet, "
+                "continuing while retrying in the background"
+            )
+
         if config.mqtt_fatal_error:
             logging.error("MQTT connection failed, exiting")
             sys.exit(1)
@@ -272,18 +395,24 @@ def setup_mqtt() -> Optional[mqtt.Client]:
         sys.exit(1)
 
 
-def publish_home_assistant_discovery(device_mac: str) -> None:
-    """
-    Publish Home Assistant MQTT discovery messages for sensor entities.
+@lru_cache(maxsize=4)
+def _device_id(device_mac: str) -> str:
+    """Sanitize MAC address for MQTT topics and entity IDs."""
+    return device_mac.replace(":", "").lower()
 
-    This creates automatic sensor discovery in Home Assistant without
-    manual configuration.
+
+# Serialized Home Assistant discovery messages per device MAC: [(topic, payload)]
+_discovery_cache: Dict[str, List[Tuple[str, bytes]]] = {}
+
+
+def build_home_assistant_discovery(device_mac: str) -> List[Tuple[str, bytes]]:
     """
-    if not config.mqtt_client or not config.mqtt_auto_discovery:
-        return
+    Build Home Assistant MQTT discovery messages for sensor entities.
 
-    # Sanitize MAC address for entity IDs
-    device_id = device_mac.replace(":", "").lower()
+    Returns:
+        List of (discovery topic, JSON payload) tuples
+    """
+    device_id = _device_id(device_mac)
 
     # Base device information
     device_info = {
@@ -336,7 +465,7 @@ def publish_home_assistant_discovery(device_mac: str) -> None:
         },
     ]
 
-    # Publish discovery message for each sensor
+    messages = []
     for sensor in sensors:
         entity_id = f"vson_{device_id}_{sensor['key']}"
         discovery_topic = f"homeassistant/sensor/{entity_id}/config"
@@ -357,31 +486,64 @@ def publish_home_assistant_discovery(device_mac: str) -> None:
         if "state_class" in sensor:
             config_payload["state_class"] = sensor["state_class"]
 
-        logging.debug(
-            "Discovery config for %s: %s",
-            sensor["name"],
-            json.dumps(config_payload, indent=2),
-        )
+        if _root_logger.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "Discovery config for %s: %s",
+                sensor["name"],
+                json.dumps(config_payload, indent=2),
+            )
 
-        config.mqtt_client.publish(
-            discovery_topic, json.dumps(config_payload), retain=True
-        )
-        logging.debug("Published HA discovery for %s", sensor["name"])
+        messages.append((discovery_topic, json_dumps_bytes(config_payload)))
+
+    return messages
+
+
+def publish_home_assistant_discovery(device_mac: str) -> None:
+    """
+    Publish Home Assistant MQTT discovery messages for sensor entities.
+
+    This creates automatic sensor discovery in Home Assistant without
+    manual configuration. Messages are built once per device and reused
+    on reconnection.
+    """
+    if not config.mqtt_client or not config.mqtt_auto_discovery:
+        return
 
+    messages = _discovery_cache.get(device_mac)
+    if messages is None:
+        messages = build_home_assistant_discovery(device_mac)
+        _discovery_cache[device_mac] = messages
+
+    # Queue the whole burst back to back on the existing connection; the
+    # network thread flushes it without a second broker session
+    publish = config.mqtt_client.publish
+    for discovery_topic, payload in messages:
+        publish(discovery_topic, payload, retain=True)
+
+    logging.debug("Published %d HA discovery messages", len(messages))
     logging.info("Home Assistant MQTT discovery messages published")
 
 
 def publish_mqtt(data: Dict[str, Any], device_mac: str) -> None:
-    """Publish decoded sensor data to MQTT."""
+    """
+    Publish decoded sensor data to MQTT.
+
+    The first reading is published immediately. Readings arriving within
+    the configured publish interval after it are coalesced, and only the
+    latest one is published when the interval ends.
+    """
     if not config.mqtt_client:
         return
 
-    device_id = device_mac.replace(":", "").lower()
-    state_topic = f"{config.mqtt_topic}/{device_id}/state"
+    # Topic prefix and device are fixed for the run, so derive the topic once
+    state_topic = config.mqtt_state_topic
+    if state_topic is None:
+        state_topic = f"{config.mqtt_topic}/{_device_id(device_mac)}/state"
+        config.mqtt_state_topic = state_topic
 
     # Build state payload
     payload = {
-        "timestamp": data.get("timestamp", datetime.now().isoformat()),
+        "timestamp": data.get("timestamp") or datetime.now().isoformat(),
         "pm25": data.get("pm25", 0),
         "pm1": data.get("pm1", 0),
         "pm10": data.get("pm10", 0),
@@ -390,67 +552,57 @@ def publish_mqtt(data: Dict[str, Any], device_mac: str) -> None:
         "flag": data.get("flag_meaning", "unknown"),
     }
 
-    config.mqtt_client.publish(state_topic, json.dumps(payload))
-    logging.debug("Published to MQTT: %s", state_topic)
+    sensor_state.mqtt_pending = (state_topic, payload)
+    if sensor_state.mqtt_flush_handle is None:
+        flush_mqtt()
 
 
-# ==== Protocol Utilities ====
+def flush_mqtt(reschedule: bool = True) -> None:
+    """
+    Publish the pending MQTT state, if any, and start a new interval.
 
+    Pass reschedule=False on shutdown to send the last reading without
+    arming another interval timer.
+    """
+    if sensor_state.mqtt_flush_handle is not None:
+        sensor_state.mqtt_flush_handle.cancel()
+        sensor_state.mqtt_flush_handle = None
 
-def hex_str(b: bytes) -> str:
-    """Convert bytes to space-separated hex string."""
-    return " ".join(f"{x:02x}" for x in b)
+    pending = sensor_state.mqtt_pending
+    if pending is None or not config.mqtt_client:
+        return
+    sensor_state.mqtt_pending = None
 
+    state_topic, payload = pending
+    config.mqtt_client.publish(state_topic, json_dumps_bytes(payload))
+    logging.debug("Published to MQTT: %s", state_topic)
 
-def u16_le(buf: bytes, off: int) -> int:
-    """Read unsigned 16-bit little-endian integer from buffer."""
-    return buf[off] | (buf[off + 1] << 8)
+    if reschedule and config.mqtt_publish_interval > 0:
+        sensor_state.mqtt_flush_handle = asyncio.get_running_loop().call_later(
+            config.mqtt_publish_interval, flush_mqtt
+        )
 
 
-# ==== Protocol Decoders ====
+# ==== Protocol Utilities ====
 
+# Payload buffers accepted by decoders (notifications are passed as memoryview)
+Buffer = Union[bytes, bytearray, memoryview]
 
-def decode_header_datetime(header: bytes) -> Optional[Dict[str, int]]:
-    """
-    Decode 6-byte datetime header.
-
-    Header format:
-        [0] = year offset (2000 + value)
-        [1] = month
-        [2] = day
-        [3] = hour (24h)
-        [4] = minute
-        [5] = second
-    """
-    if len(header) != 6:
-        return None
 
-    year_offset = header[0]
-    month = header[1]
-    day = header[2]
-    hour = header[3]
-    minute = header[4]
-    second = header[5]
+def hex_str(b: Buffer) -> str:
+    """Convert bytes to space-separated hex string."""
+    return b.hex(" ")
 
-    year_2000 = 2000 + year_offset
 
-    return {
-        "year_offset": year_offset,
-        "year_2000": year_2000,
-        "month": month,
-        "day": day,
-        "hour": hour,
-        "minute": minute,
-        "second": second,
-    }
+# ==== Protocol Decoders ====
 
 
-def decode_data_frame(payload: bytes) -> Optional[Dict[str, Any]]:
+def decode_data_frame(payload: Buffer) -> Optional[Dict[str, Any]]:
     """
     Decode main DATA frame (20 bytes).
 
     Frame format:
-        [0..5]   datetime header
+        [0..5]   datetime header: year-2000, month, day, hour (24h), minute, second
         [6..7]   pm2.5 (u16 LE)
         [8..9]   pm1 (u16 LE)
         [10..11] pm10 (u16 LE)
@@ -467,28 +619,37 @@ def decode_data_frame(payload: bytes) -> Optional[Dict[str, Any]]:
     if len(payload) != PACKET_SIZE_DATA:
         return None
 
-    header = payload[0:6]
-    header_decoded = decode_header_datetime(header)
-
-    pm25 = u16_le(payload, 6)
-    pm1 = u16_le(payload, 8)
-    pm10 = u16_le(payload, 10)
-    unknown1 = u16_le(payload, 12)
-    unused4 = payload[14:18]
-    counter = payload[18]
-    flag = payload[19]
+    (
+        year_offset,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        pm25,
+        pm1,
+        pm10,
+        unknown1,
+        unused4,
+        counter,
+        flag,
+    ) = _DATA_STRUCT.unpack_from(payload)
 
     # Calculate particle count using device formula
-    msb = (pm25 >> 8) & 0xFF
+    msb = pm25 >> 8
     lsb = pm25 & 0xFF
-    particles = (
-        msb * PARTICLE_MULTIPLIER_BASE
-        + (lsb * PARTICLE_MULTIPLIER_LSB * PARTICLE_MULTIPLIER_CORRECTION)
-        / PARTICLE_DIVISOR
-    )
+    particles = msb * PARTICLE_MULTIPLIER_BASE + lsb * _PARTICLE_LSB_SCALE
 
     return {
-        "header": header_decoded,
+        "header": {
+            "year_offset": year_offset,
+            "year_2000": 2000 + year_offset,
+            "month": month,
+            "day": day,
+            "hour": hour,
+            "minute": minute,
+            "second": second,
+        },
         "pm25": pm25,
         "pm1": pm1,
         "pm10": pm10,
@@ -503,7 +664,7 @@ def decode_data_frame(payload: bytes) -> Optional[Dict[str, Any]]:
     }
 
 
-def decode_status_battery(payload: bytes) -> Optional[Dict[str, int]]:
+def decode_status_battery(payload: Buffer) -> Optional[Dict[str, int]]:
     """
     Decode STATUS characteristic (battery level).
 
@@ -515,7 +676,7 @@ def decode_status_battery(payload: bytes) -> Optional[Dict[str, int]]:
     return {"battery_raw": level, "battery_percent": level}
 
 
-def decode_meta_time_mode(payload: bytes) -> Optional[Dict[str, int]]:
+def decode_meta_time_mode(payload: Buffer) -> Optional[Dict[str, int]]:
     """
     Decode META characteristic (time confirmation + mode).
 
@@ -532,18 +693,13 @@ def decode_meta_time_mode(payload: bytes) -> Optional[Dict[str, int]]:
     if len(payload) != PACKET_SIZE_META:
         return None
 
-    flag = payload[0]
-    year = 2000 + payload[1]
-    month = payload[2]
-    day = payload[3]
-    hour = payload[4]
-    minute = payload[5]
-    second = payload[6]
-    mode = payload[7]
+    flag, year_offset, month, day, hour, minute, second, mode = (
+        _META_STRUCT.unpack_from(payload)
+    )
 
     return {
         "flag": flag,
-        "year": year,
+        "year": 2000 + year_offset,
         "month": month,
         "day": day,
         "hour": hour,
@@ -556,6 +712,18 @@ def decode_meta_time_mode(payload: bytes) -> Optional[Dict[str, int]]:
 # ==== Output Formatting ====
 
 
+def format_header_timestamp(h: Dict[str, int], sep: str = " ") -> str:
+    """
+    Format decoded datetime header as "YYYY-MM-DD HH:MM:SS".
+
+    Pass sep="T" for an ISO 8601 timestamp.
+    """
+    return (
+        f"{h['year_2000']:04d}-{h['month']:02d}-{h['day']:02d}{sep}"
+        f"{h['hour']:02d}:{h['minute']:02d}:{h['second']:02d}"
+    )
+
+
 def output_text_data(decoded: Dict[str, Any]) -> None:
     """Format and print DATA frame in human-readable text format."""
     logging.info(
@@ -572,13 +740,7 @@ def output_json_data(decoded: Dict[str, Any]) -> None:
     """Format and print DATA frame as JSON line."""
     h = decoded.get("header")
 
-    if h:
-        timestamp = (
-            f"{h['year_2000']:04d}-{h['month']:02d}-{h['day']:02d} "
-            f"{h['hour']:02d}:{h['minute']:02d}:{h['second']:02d}"
-        )
-    else:
-        timestamp = None
+    timestamp = format_header_timestamp(h) if h else None
 
     output = {
         "timestamp": timestamp,
@@ -589,7 +751,7 @@ def output_json_data(decoded: Dict[str, Any]) -> None:
         "battery": sensor_state.latest_battery,
     }
 
-    print(json.dumps(output))
+    print(json_dumps_str(output))
 
 
 def output_text_battery(decoded: Dict[str, int]) -> None:
@@ -603,139 +765,183 @@ def output_json_battery(decoded: Dict[str, int]) -> None:
         "type": "battery",
         "battery": decoded["battery_percent"],
     }
-    print(json.dumps(output))
+    print(json_dumps_str(output))
 
 
 # ==== Notification Handler ====
 
 
-def notification_handler(ch, data: bytearray) -> None:
-    """
-    Handle BLE notifications from sensor.
+def _handle_data(b: memoryview) -> None:
+    """Handle DATA notification: main air quality measurements."""
+    decoded = decode_data_frame(b)
+    if decoded is None:
+        logging.warning(
+            "Invalid DATA frame (expected %s bytes, got %s)",
+            PACKET_SIZE_DATA,
+            len(b),
+        )
+        return
 
-    Decodes incoming data packets and outputs according to configured format.
-    Optionally publishes to MQTT.
-    """
-    b = bytes(data)
-    handle = ch.handle
-    uuid = str(ch.uuid)
-    uuid_lower = uuid.lower()
+    # Skip historical records unless explicitly requested
+    if decoded["flag"] == 0 and not config.include_history:
+        logging.debug("Skipping historical record (counter=%s)", decoded["counter"])
+        return
 
-    logging.debug(
-        "Notification: handle=0x%04x, uuid=%s, bytes=%s", handle, uuid, hex_str(b)
-    )
+    # Output to console
+    if config.output_format == "json":
+        output_json_data(decoded)
+    else:
+        output_text_data(decoded)
 
-    # Update last data time for any notification
-    sensor_state.last_data_time = time.time()
+    # Publish to MQTT
+    if config.mqtt_enabled:
+        # Device clock is synchronized on connect, so the frame header
+        # timestamp is used instead of reading the host clock per packet
+        h = decoded["header"]
+        mqtt_data = {
+            "timestamp": (
+                format_header_timestamp(h, "T") if h else datetime.now().isoformat()
+            ),
+            "pm1": decoded["pm1"],
+            "pm25": decoded["pm25"],
+            "pm10": decoded["pm10"],
+            "particles": round(decoded["particles"], 2),
+            "battery": sensor_state.latest_battery,
+            "flag_meaning": decoded["flag_meaning"],
+        }
+        publish_mqtt(mqtt_data, config.device_address)
 
-    # DATA: main air quality measurements
-    if uuid_lower == UUID_DATA.lower():
-        decoded = decode_data_frame(b)
-        if decoded is None:
+
+def _handle_status(b: memoryview) -> None:
+    """Handle STATUS notification: battery level."""
+    decoded = decode_status_battery(b)
+    if decoded is None:
+        logging.warning("Invalid STATUS frame")
+        return
+
+    sensor_state.latest_battery = decoded["battery_percent"]
+
+    # Only output battery on first read or significant change
+    logging.info("Battery level: %s%%", decoded["battery_percent"])
+
+
+def _handle_meta(b: memoryview) -> None:
+    """Handle META notification: time confirmation + mode."""
+    # Check packet type based on first byte (flag)
+    if len(b) == 0:
+        logging.warning("Empty META frame received")
+        return
+
+    flag = b[0]
+
+    # Flag 0x01: time confirmation (expect 8 bytes)
+    if flag == META_FLAG_TIME_CONFIRMATION:
+        if len(b) != PACKET_SIZE_META_LONG:
             logging.warning(
-                "Invalid DATA frame (expected %s bytes, got %s)",
-                PACKET_SIZE_DATA,
+                "Invalid META frame with flag 0x01 (expected %s bytes, got %s)",
+                PACKET_SIZE_META_LONG,
                 len(b),
             )
             return
 
-        # Skip historical records unless explicitly requested
-        if decoded["flag"] == 0 and not config.include_history:
-            logging.debug("Skipping historical record (counter=%s)", decoded["counter"])
+        decoded = decode_meta_time_mode(b)
+        if decoded is None:
+            logging.warning("Failed to decode META time confirmation")
             return
 
-        # Output to console
-        if config.output_format == "json":
-            output_json_data(decoded)
-        else:
-            output_text_data(decoded)
-
-        # Publish to MQTT
-        if config.mqtt_enabled:
-            mqtt_data = {
-                "timestamp": datetime.now().isoformat(),
-                "pm1": decoded["pm1"],
-                "pm25": decoded["pm25"],
-                "pm10": decoded["pm10"],
-                "particles": round(decoded["particles"], 2),
-                "battery": sensor_state.latest_battery,
-                "flag_meaning": decoded["flag_meaning"],
-            }
-            publish_mqtt(mqtt_data, config.device_address)
-
-        return
+        logging.info(
+            "Device time confirmed: %04d-%02d-%02d %02d:%02d:%02d, mode=%s",
+            decoded["year"],
+            decoded["month"],
+            decoded["day"],
+            decoded["hour"],
+            decoded["minute"],
+            decoded["second"],
+            decoded["mode"],
+        )
 
-    # STATUS: battery level
-    if uuid_lower == UUID_STATUS.lower():
-        decoded = decode_status_battery(b)
-        if decoded is None:
-            logging.warning("Invalid STATUS frame")
+    # Flag 0x02: short response (expect 2 bytes, don't decode)
+    elif flag == META_FLAG_SHORT_RESPONSE:
+        if len(b) != PACKET_SIZE_META_SHORT:
+            logging.warning(
+                "Invalid META frame with flag 0x02 (expected %s bytes, got %s)",
+                PACKET_SIZE_META_SHORT,
+                len(b),
+            )
             return
 
-        sensor_state.latest_battery = decoded["battery_percent"]
+        if _root_logger.isEnabledFor(logging.DEBUG):
+            logging.debug("Device sent META short response: %s", hex_str(b))
 
-        # Only output battery on first read or significant change
-        logging.info("Battery level: %s%%", decoded["battery_percent"])
+    # Unknown flag
+    else:
+        logging.warning("Unknown META flag 0x%02x, data: %s", flag, hex_str(b))
 
-        return
 
-    # META: time confirmation + mode
-    if uuid_lower == UUID_META.lower():
-        # Check packet type based on first byte (flag)
-        if len(b) == 0:
-            logging.warning("Empty META frame received")
-            return
+def _handle_short(b: memoryview) -> None:
+    """Handle SHORT notification (not decoded yet)."""
+    if _root_logger.isEnabledFor(logging.DEBUG):
+        logging.debug("SHORT notification (not decoded): %s", hex_str(b))
 
-        flag = b[0]
 
-        # Flag 0x01: time confirmation (expect 8 bytes)
-        if flag == META_FLAG_TIME_CONFIRMATION:
-            if len(b) != PACKET_SIZE_META_LONG:
-                logging.warning(
-                    "Invalid META frame with flag 0x01 (expected %s bytes, got %s)",
-                    PACKET_SIZE_META_LONG,
-                    len(b),
-                )
-                return
+# Notification handlers keyed by lowercase characteristic UUID
+_NOTIFICATION_HANDLERS: Dict[str, Callable[[memoryview], None]] = {
+    UUID_DATA.lower(): _handle_data,
+    UUID_STATUS.lower(): _handle_status,
+    UUID_META.lower(): _handle_meta,
+    UUID_SHORT.lower(): _handle_short,
+}
 
-            decoded = decode_meta_time_mode(b)
-            if decoded is None:
-                logging.warning("Failed to decode META time confirmation")
-                return
 
-            logging.info(
-                "Device time confirmed: %04d-%02d-%02d %02d:%02d:%02d, mode=%s",
-                decoded["year"],
-                decoded["month"],
-                decoded["day"],
-                decoded["hour"],
-                decoded["minute"],
-                decoded["second"],
-                decoded["mode"],
-            )
+def _ignore_notification(b: Buffer) -> None:
+    """Drop notifications from characteristics without a decoder."""
 
-        # Flag 0x02: short response (expect 2 bytes, don't decode)
-        elif flag == META_FLAG_SHORT_RESPONSE:
-            if len(b) != PACKET_SIZE_META_SHORT:
-                logging.warning(
-                    "Invalid META frame with flag 0x02 (expected %s bytes, got %s)",
-                    PACKET_SIZE_META_SHORT,
-                    len(b),
-                )
-                return
 
-            logging.debug("Device sent META short response: %s", hex_str(b))
+# Resolved handler per characteristic object; Bleak passes the same
+# instance for every notification, so the UUID is normalized only once
+_handler_cache: "WeakKeyDictionary[Any, Callable[[memoryview], None]]" = WeakKeyDictionary()
 
-        # Unknown flag
-        else:
-            logging.warning("Unknown META flag 0x%02x, data: %s", flag, hex_str(b))
 
-        return
+def _resolve_handler(ch) -> Callable[[memoryview], None]:
+    """Look up and cache the notification handler for a characteristic."""
+    handler = _NOTIFICATION_HANDLERS.get(str(ch.uuid).lower(), _ignore_notification)
+    try:
+        _handler_cache[ch] = handler
+    except TypeError:
+        pass  # Not weak-referenceable; resolve again on the next packet
+    return handler
 
-    # SHORT: not decoded yet
-    if uuid_lower == UUID_SHORT.lower():
-        logging.debug("SHORT notification (not decoded): %s", hex_str(b))
-        return
+
+def notification_handler(ch, data: bytearray) -> None:
+    """
+    Handle BLE notifications from sensor.
+
+    Decodes incoming data packets and outputs according to configured format.
+    Optionally publishes to MQTT.
+    """
+    # View the buffer instead of copying it; decoders only index and unpack
+    b = memoryview(data)
+
+    if _root_logger.isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Notification: handle=0x%04x, uuid=%s, bytes=%s",
+            ch.handle,
+            ch.uuid,
+            hex_str(b),
+        )
+
+    # Update last data time for any notification
+    state = sensor_state
+    state.last_data_time = time.time()
+    data_event = state.data_event
+    if data_event is not None:
+        data_event.set()
+
+    try:
+        handler = _handler_cache[ch]
+    except (KeyError, TypeError):
+        handler = _resolve_handler(ch)
+    handler(b)
 
 
 # ==== Device Initialization ====
@@ -752,14 +958,14 @@ def build_auth_key() -> Tuple[bytes, str]:
         Tuple of (key bytes, random number string)
     """
     rand_num = random.randint(0, 999999)
-    num_str = f"{rand_num:06d}"
-    ascii_digits = num_str.encode("ascii")
+    ascii_digits = b"%06d" % rand_num
 
-    prefix = b"\x00\x01"
-    tail = b"\x00" * 10
-    key = prefix + ascii_digits + tail
+    # Zero-filled packet; only the prefix and the digits need writing
+    key = bytearray(18)
+    key[1] = 0x01
+    key[2:8] = ascii_digits
 
-    return key, num_str
+    return bytes(key), ascii_digits.decode("ascii")
 
 
 def build_time_sync() -> Tuple[bytes, datetime]:
@@ -778,24 +984,19 @@ def build_time_sync() -> Tuple[bytes, datetime]:
     if not (0 <= year_offset <= 255):
         year_offset = 0
 
-    time_bytes = bytes(
-        [
-            year_offset & 0xFF,
-            now.month & 0xFF,
-            now.day & 0xFF,
-            now.hour & 0xFF,
-            now.minute & 0xFF,
-            now.second & 0xFF,
-        ]
-    )
-
-    tail = bytes.fromhex("00 06 40 00 1e")
-    time_sync = time_bytes + tail
+    time_sync = bytearray(11)
+    time_sync[0] = year_offset & 0xFF
+    time_sync[1] = now.month
+    time_sync[2] = now.day
+    time_sync[3] = now.hour
+    time_sync[4] = now.minute
+    time_sync[5] = now.second
+    time_sync[6:] = _TIME_SYNC_TAIL
 
-    return time_sync, now
+    return bytes(time_sync), now
 
 
-async def initialize_device(client: BleakClient) -> None:
+async def initialize_device(client: "BleakClient") -> None:
     """
     Initialize BLE device with required handshake sequence.
 
@@ -810,17 +1011,26 @@ async def initialize_device(client: BleakClient) -> None:
     # Enable notifications
     logging.debug("Enabling notifications...")
 
-    await client.start_notify(UUID_STATUS, notification_handler)
-    logging.debug("STATUS notifications enabled")
-
-    await client.start_notify(UUID_SHORT, notification_handler)
-    logging.debug("SHORT notifications enabled")
-
-    await client.start_notify(UUID_META, notification_handler)
-    logging.debug("META notifications enabled")
+    async def _enable(uuid: str, name: str) -> None:
+        await client.start_notify(uuid, notification_handler)
+        logging.debug("%s notifications enabled", name)
+
+    # Issue the CCCD writes concurrently so their round trips overlap.
+    # BlueZ queues them safely; on a backend that rejects overlapping GATT
+    # operations, await the four _enable() calls one after another instead.
+    results = await asyncio.gather(
+        _enable(UUID_STATUS, "STATUS"),
+        _enable(UUID_SHORT, "SHORT"),
+        _enable(UUID_META, "META"),
+        _enable(UUID_DATA, "DATA"),
+        return_exceptions=True,
+    )
 
-    await client.start_notify(UUID_DATA, notification_handler)
-    logging.debug("DATA notifications enabled")
+    # All writes have settled, so none is left running into the connection
+    # teardown; report the first failure
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
     # Authentication key
     auth_key, auth_code = build_auth_key()
@@ -850,6 +1060,9 @@ async def initialize_device(client: BleakClient) -> None:
 
 async def monitor_device_connection() -> None:
     """Single connection attempt - connect to device and process notifications."""
+    from bleak import BleakClient
+    from bleak.exc import BleakError
+
     # Check for MQTT fatal error before attempting BLE connection
     if config.mqtt_fatal_error:
         logging.error("Aborting due to MQTT connection failure")
@@ -865,6 +1078,10 @@ async def monitor_device_connection() -> None:
 
             logging.info("Connected successfully")
 
+            # Notifications wake the monitoring loop through this event
+            sensor_state.data_event = asyncio.Event()
+            sensor_state.event_loop = asyncio.get_running_loop()
+
             # Service discovery (required by Bleak)
             logging.debug("Performing service discovery...")
             _ = client.services
@@ -873,6 +1090,9 @@ async def monitor_device_connection() -> None:
             # Initialize device
             await initialize_device(client)
 
+            # Session established: the next reconnection starts a fresh backoff
+            sensor_state.reconnect_attempt = 0
+
             # Publish Home Assistant discovery (if enabled)
             if config.mqtt_auto_discovery:
                 publish_home_assistant_discovery(config.device_address)
@@ -883,25 +1103,28 @@ async def monitor_device_connection() -> None:
             # Initialize last data time
             sensor_state.last_data_time = time.time()
 
+            # Fixed for this connection; keep them local to the loop
+            data_event = sensor_state.data_event
+            response_timeout = config.response_timeout
+
             while True:
                 # Check for MQTT fatal error during monitoring
                 if config.mqtt_fatal_error:
                     logging.error("MQTT connection lost, stopping monitoring")
                     break
 
-                # Check for response timeout
-                if sensor_state.last_data_time is not None:
-                    time_since_last_data = time.time() - sensor_state.last_data_time
-                    if time_since_last_data > config.response_timeout:
-                        logging.warning(
-                            "No response from device for %.0f seconds (timeout: %d seconds). Reconnecting...",
-                            time_since_last_data,
-                            config.response_timeout
-                        )
-                        # Break out of the loop to trigger reconnection
-                        break
-
-                await asyncio.sleep(1)
+                # Sleep until the next notification or the response timeout
+                data_event.clear()
+                try:
+                    await asyncio.wait_for(data_event.wait(), timeout=response_timeout)
+                except asyncio.TimeoutError:
+                    logging.warning(
+                        "No response from device for %.0f seconds (timeout: %d seconds). Reconnecting...",
+                        time.time() - sensor_state.last_data_time,
+                        response_timeout
+                    )
+                    # Break out of the loop to trigger reconnection
+                    break
 
     except asyncio.CancelledError:
         logging.debug("Monitoring cancelled")
@@ -952,39 +1175,61 @@ async def monitor_device_connection() -> None:
         raise
 
 
+def reconnect_delay(attempt: int) -> float:
+    """
+    Delay before a reconnection attempt.
+
+    Exponential backoff from RECONNECT_DELAY_BASE, capped at
+    RECONNECT_DELAY_MAX, with +/-50% jitter so retries do not synchronize.
+    """
+    delay = min(RECONNECT_DELAY_MAX, RECONNECT_DELAY_BASE * 2 ** min(attempt, 16))
+    return delay * (0.5 + random.random())
+
+
 async def monitor_device() -> None:
     """Main monitoring loop with automatic reconnection on timeout or errors."""
-    retry_delay = 5  # seconds between reconnection attempts
-    
+    from bleak.exc import BleakError
+
     while True:
         try:
+            # Resets sensor_state.reconnect_attempt once the device is initialized
             await monitor_device_connection()
-            # If we exit normally (timeout detected), try to reconnect
-            logging.info("Attempting to reconnect in %d seconds...", retry_delay)
-            await asyncio.sleep(retry_delay)
+            # If we exit normally (timeout or failed connect), try to reconnect
         except KeyboardInterrupt:
             logging.info("Interrupted by user, shutting down...")
             raise
         except asyncio.CancelledError:
             logging.debug("Monitoring cancelled")
             raise
-        except BleakError as e:
-            # Connection errors - attempt to reconnect
-            logging.warning("Connection lost: %s", e)
-            logging.info("Attempting to reconnect in %d seconds...", retry_delay)
-            await asyncio.sleep(retry_delay)
-        except (OSError, RuntimeError, ValueError) as e:
-            logging.error("Unexpected error: %s", e, exc_info=config.debug)
-            logging.info("Attempting to reconnect in %d seconds...", retry_delay)
-            await asyncio.sleep(retry_delay)
-
-
-def parse_arguments():
-    """Parse and validate command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Monitor VSON WP6810 air quality sensor via BLE",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        except (asyncio.TimeoutError, BleakError, OSError, RuntimeError, ValueError) as e:
+            if isinstance(e, (asyncio.TimeoutError, BleakError)):
+                # Connection errors - attempt to reconnect
+                logging.warning("Connection lost: %s", e)
+            else:
+                logging.error("Unexpected error: %s", e, exc_info=config.debug)
+
+        # Single reconnect path for both outcomes
+        retry_delay = reconnect_delay(sensor_state.reconnect_attempt)
+        sensor_state.reconnect_attempt += 1
+        logging.info("Attempting to reconnect in %.1f seconds...", retry_delay)
+        await asyncio.sleep(retry_delay)
+
+
+def is_valid_mac(value: str) -> bool:
+    """Check for six hex byte pairs joined by a consistent ':' or '-'."""
+    if len(value) != 17:
+        return False
+    sep = value[2]
+    if sep not in ":-" or value[2::3] != sep * 5:
+        return False
+    return all(c in _HEX_DIGITS for c in value[0::3] + value[1::3])
+
+
+# Accepted --output and --log-level values (tuples keep help/usage order)
+_OUTPUT_CHOICES = ("text", "json")
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+_EPILOG = """
 Examples:
   %(prog)s --device 20:C3:8F:DA:96:DE
   %(prog)s --device 20:C3:8F:DA:96:DE --output json
@@ -996,13 +1241,25 @@ Output format:
     2025-01-15 14:30:25 [INFO] PM1:   12 µg/m³  PM2.5:   18 µg/m³  PM10:   22 µg/m³  ...
   
   json: JSON lines format (one object per line)
-    {"timestamp": "2025-01-15 14:30:25", "pm1": 12, "pm25": 18, "pm10": 22, ...}
-        """,
+    {"timestamp":"2025-01-15 14:30:25","pm1":12,"pm25":18,"pm10":22,...}
+"""
+
+
+@lru_cache(maxsize=1)
+def build_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser (once per process)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Monitor VSON WP6810 air quality sensor via BLE",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Required arguments
     parser.add_argument(
         "--device",
+        dest="device_address",
         required=True,
         metavar="MAC",
         help="BLE device MAC address (e.g., 20:C3:8F:DA:96:DE)",
@@ -1011,7 +1268,8 @@ Output format:
     # Output options
     parser.add_argument(
         "--output",
-        choices=["text", "json"],
+        dest="output_format",
+        choices=_OUTPUT_CHOICES,
         default="text",
         help="Output format (default: text)",
     )
@@ -1025,6 +1283,7 @@ Output format:
     # MQTT options
     parser.add_argument(
         "--mqtt",
+        dest="mqtt_enabled",
         action="store_true",
         help="Enable MQTT publishing",
     )
@@ -1058,8 +1317,19 @@ Output format:
         help="MQTT topic prefix (default: homeassistant/sensor/vson_MACADDR)",
     )
 
+    parser.add_argument(
+        "--mqtt-interval",
+        dest="mqtt_publish_interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="Minimum interval between MQTT state publishes; readings in between "
+             "are coalesced and only the latest is sent (default: 1, 0 = every reading)",
+    )
+
     parser.add_argument(
         "--mqtt-auto-home-assistant",
+        dest="mqtt_auto_discovery",
         action="store_true",
         help="Enable Home Assistant MQTT discovery",
     )
@@ -1073,19 +1343,21 @@ Output format:
 
     parser.add_argument(
         "--log",
+        dest="log_file",
         metavar="FILE",
         help="Log to file",
     )
 
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        choices=_LOG_LEVEL_CHOICES,
         default="INFO",
         help="File log level (default: INFO)",
     )
 
     parser.add_argument(
         "--timeout",
+        dest="response_timeout",
         type=int,
         default=300,
         metavar="SECONDS",
@@ -1093,20 +1365,28 @@ Output format:
              "If no data is received within this time, reconnection will be attempted.",
     )
 
+    return parser
+
+
+def parse_arguments():
+    """Parse and validate command line arguments."""
+    parser = build_parser()
     args = parser.parse_args()
 
     # Validation
-    if args.mqtt_auto_home_assistant and not args.mqtt:
+    if args.mqtt_auto_discovery and not args.mqtt_enabled:
         parser.error("--mqtt-auto-home-assistant requires --mqtt")
     
-    if args.timeout < 1:
+    if args.response_timeout < 1:
         parser.error("--timeout must be at least 1 second")
 
+    if args.mqtt_publish_interval < 0:
+        parser.error("--mqtt-interval must not be negative")
+
     # Validate MAC address format
-    mac_pattern = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}$")
-    if not mac_pattern.match(args.device):
+    if not is_valid_mac(args.device_address):
         parser.error(
-            f"Invalid MAC address format: {args.device}\n"
+            f"Invalid MAC address format: {args.device_address}\n"
             f"Expected format: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX (hexadecimal digits)"
         )
 
@@ -1117,28 +1397,14 @@ async def main():
     """Application entry point."""
     args = parse_arguments()
 
-    # Configure global config
-    config.device_address = args.device
-    config.output_format = args.output
-    config.include_history = args.include_history
-    config.mqtt_enabled = args.mqtt
-    config.mqtt_host = args.mqtt_host
-    config.mqtt_port = args.mqtt_port
-    config.mqtt_user = args.mqtt_user
-    config.mqtt_password = args.mqtt_password
+    # Configure global config (argument dest names match Config attributes)
+    for name, value in vars(args).items():
+        setattr(config, name, value)
 
     # Set MQTT topic (base without device ID, it will be added in state_topic)
-    if args.mqtt_topic:
-        config.mqtt_topic = args.mqtt_topic
-    else:
+    if not config.mqtt_topic:
         config.mqtt_topic = "homeassistant/sensor/vson"
 
-    config.mqtt_auto_discovery = args.mqtt_auto_home_assistant
-    config.debug = args.debug
-    config.log_file = args.log
-    config.log_level = args.log_level
-    config.response_timeout = args.timeout
-
     # Setup logging
     setup_logging()
 
@@ -1146,6 +1412,17 @@ async def main():
     if config.mqtt_enabled:
         config.mqtt_client = setup_mqtt()
 
+    # SIGINT/SIGTERM cancel this task, so the BLE connection and MQTT client
+    # are closed through the normal cleanup path below
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, main_task.cancel)
+        except NotImplementedError:
+            # Not available on Windows; Ctrl+C raises KeyboardInterrupt instead
+            pass
+
     # Start monitoring
     try:
         await monitor_device()
@@ -1153,14 +1430,26 @@ async def main():
         logging.info("Interrupted by user, shutting down...")
     finally:
         if config.mqtt_client:
-            config.mqtt_client.loop_stop()
+            # Send the last coalesced reading before closing the connection
+            flush_mqtt(reschedule=False)
+            # Disconnect first: the network thread sends the queued publish and
+            # DISCONNECT, then exits, so loop_stop() joins it without waiting
             config.mqtt_client.disconnect()
+            config.mqtt_client.loop_stop()
             logging.debug("MQTT client disconnected")
 
 
 if __name__ == "__main__":
+    # Use uvloop's event loop when installed (uvloop.run needs uvloop >= 0.18)
+    try:
+        import uvloop
+
+        run = uvloop.run
+    except (ImportError, AttributeError):
+        run = asyncio.run
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logging.info("Exiting cleanly")
     except SystemExit: